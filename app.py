@@ -7,9 +7,10 @@ with a three-level structure: stages, substages, and tools.
 
 import streamlit as st
 import pandas as pd
-import json
+import html
 import os
 from utils.data_loader import load_lifecycle_data
+from utils.data_extractor import extract_categories_by_stage
 from utils.visualization import create_lifecycle_visualization
 
 # Page configuration
@@ -20,9 +21,159 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Add custom CSS
-with open(os.path.join("utils", "styles.css")) as f:
-    st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+@st.cache_data(show_spinner=False)
+def _style_tag(path):
+    """
+    Read a stylesheet and wrap it in a <style> tag once per process.
+    
+    Args:
+        path (str): Path to the CSS file.
+        
+    Returns:
+        str: The stylesheet contents wrapped in a <style> element.
+    """
+    with open(path) as f:
+        return f"<style>{f.read()}</style>"
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _build_fig(view_mode, selected_stage, selected_categories, show_connections,
+               show_substages, show_tools, connection_types):
+    """
+    Build the lifecycle figure, reusing the cached one for unchanged controls.
+    
+    List arguments are passed as tuples so the cache key hashes stably. The
+    figure is shared rather than copied, because unpickling a cached Figure
+    costs about as much as building it again; callers must not modify it.
+    
+    Args:
+        view_mode (str): The view mode.
+        selected_stage (str, optional): The selected stage for focused view.
+        selected_categories (tuple, optional): The selected categories for tool comparison.
+        show_connections (bool): Whether to show connections between stages.
+        show_substages (bool): Whether to show substages.
+        show_tools (bool): Whether to show tools.
+        connection_types (tuple): The types of connections to show.
+        
+    Returns:
+        plotly.graph_objects.Figure: The visualization figure.
+    """
+    return create_lifecycle_visualization(
+        load_lifecycle_data(),
+        view_mode=view_mode,
+        selected_stage=selected_stage,
+        selected_categories=list(selected_categories) if selected_categories is not None else None,
+        show_connections=show_connections,
+        show_substages=show_substages,
+        show_tools=show_tools,
+        connection_types=list(connection_types),
+        use_webgl=True
+    )
+
+@st.cache_resource(show_spinner=False)
+def _build_indexes():
+    """
+    Build the stage and category lookup tables once per process.
+    
+    The tables are shared rather than copied; callers must not modify them.
+    
+    Returns:
+        tuple: Stage dictionaries keyed by stage name, the sorted categories
+            of each stage, and the sorted names of all categories.
+    """
+    lifecycle_data = load_lifecycle_data()
+    categories_by_stage = extract_categories_by_stage(lifecycle_data)
+    return (
+        {stage["name"]: stage for stage in lifecycle_data["stages"]},
+        categories_by_stage,
+        sorted(set().union(*categories_by_stage.values()))
+    )
+
+@st.cache_data(show_spinner=False)
+def _exemplars_df():
+    """
+    Build a DataFrame of all tool exemplars once per process.
+    
+    Returns:
+        pandas.DataFrame: One row per exemplar with stage, category, name and description columns.
+    """
+    return pd.DataFrame(
+        load_lifecycle_data()["_exemplar_columns"],
+        columns=["stage", "category", "name", "description"]
+    )
+
+@st.cache_data(show_spinner=False)
+def _overview():
+    """
+    Compute the stage overview table and global counts once per process.
+    
+    Returns:
+        tuple: The overview DataFrame followed by the total numbers of stages,
+            tool categories, tools and connections.
+    """
+    lifecycle_data = load_lifecycle_data()
+    exemplars_df = _exemplars_df()
+    
+    # Count categories and tools per stage
+    category_counts = exemplars_df.groupby("stage")["category"].nunique()
+    tool_counts = exemplars_df["stage"].value_counts()
+    
+    # Create a tabular view of stages and their tools count
+    stage_data = pd.DataFrame({
+        "Stage": [stage["name"] for stage in lifecycle_data["stages"]],
+        "Description": [stage["description"] for stage in lifecycle_data["stages"]]
+    })
+    stage_data["Tool Categories"] = stage_data["Stage"].map(category_counts).fillna(0).astype(int)
+    stage_data["Total Tools"] = stage_data["Stage"].map(tool_counts).fillna(0).astype(int)
+    
+    return (
+        stage_data,
+        len(lifecycle_data["stages"]),
+        exemplars_df["category"].nunique(),
+        len(exemplars_df),
+        len(lifecycle_data["connections"])
+    )
+
+def _metrics_html(metrics):
+    """
+    Render a row of labelled metrics as a single HTML block.
+    
+    Args:
+        metrics (list): (label, value) pairs in display order.
+        
+    Returns:
+        str: HTML markup for the metrics row.
+    """
+    items = "".join(
+        f"<div class='metric-item'><div class='metric-label'>{html.escape(label)}</div>"
+        f"<div class='metric-value'>{value}</div></div>"
+        for label, value in metrics
+    )
+    return f"<div class='metrics'>{items}</div>"
+
+def _set_levels(show_connections, show_substages, show_tools):
+    """
+    Button callback that sets which levels of the visualization are shown.
+    
+    Args:
+        show_connections (bool): Whether to show connections between stages.
+        show_substages (bool): Whether to show substages.
+        show_tools (bool): Whether to show tools.
+    """
+    st.session_state.show_connections = show_connections
+    st.session_state.show_substages = show_substages
+    st.session_state.show_tools = show_tools
+
+def _reset_view():
+    """
+    Button callback that restores the default view.
+    """
+    _set_levels(True, True, False)
+    st.session_state.view_mode = "Complete Lifecycle"
+    st.session_state.pop("selected_stage", None)
+    st.session_state.pop("selected_categories", None)
+
+# Add custom CSS (emitted on every full rerun, since Streamlit removes elements a rerun does not redraw)
+st.markdown(_style_tag(os.path.join("utils", "styles.css")), unsafe_allow_html=True)
 
 # Page header
 st.title("MaLDReTH Research Data Lifecycle")
@@ -36,8 +187,9 @@ Use the controls below and to the left to explore the lifecycle and learn about
 the various tools available at each stage.
 """)
 
-# Load lifecycle data
+# Load lifecycle data (parsed once and memoized across reruns by the loader)
 lifecycle_data = load_lifecycle_data()
+stages_by_name, categories_by_stage, all_categories = _build_indexes()
 
 # Sidebar controls
 st.sidebar.header("Visualization Controls")
@@ -45,7 +197,8 @@ st.sidebar.header("Visualization Controls")
 # View mode selection
 view_mode = st.sidebar.radio(
     "Select View Mode",
-    ["Complete Lifecycle", "Focus on Stage", "Compare Tools"]
+    ["Complete Lifecycle", "Focus on Stage", "Compare Tools"],
+    key="view_mode"
 )
 
 # Stage filter for focused view
@@ -55,103 +208,70 @@ selected_categories = None
 if view_mode == "Focus on Stage":
     selected_stage = st.sidebar.selectbox(
         "Select Stage to Focus On",
-        [stage["name"] for stage in lifecycle_data["stages"]]
+        [stage["name"] for stage in lifecycle_data["stages"]],
+        key="selected_stage"
     )
     
     # Get categories for the selected stage
     if selected_stage:
-        stage_categories = set()
-        for exemplar in lifecycle_data["exemplars"]:
-            if exemplar["stage"] == selected_stage:
-                stage_categories.add(exemplar["category"])
+        stage_categories = categories_by_stage.get(selected_stage, [])
         
         if stage_categories:
             st.sidebar.markdown(f"### Categories in {selected_stage}")
-            for category in sorted(stage_categories):
+            for category in stage_categories:
                 st.sidebar.markdown(f"- {category}")
 
 elif view_mode == "Compare Tools":
     # Multi-select for tool categories
-    all_categories = set()
-    for exemplar in lifecycle_data["exemplars"]:
-        all_categories.add(exemplar["category"])
-    
     selected_categories = st.sidebar.multiselect(
         "Select Tool Categories to Compare",
-        sorted(all_categories),
-        default=list(sorted(all_categories))[:3] if len(all_categories) > 3 else list(sorted(all_categories))
+        all_categories,
+        default=all_categories[:3],
+        key="selected_categories"
     )
 
 # Display options
 st.sidebar.header("Display Options")
 
-# Level visibility controls
+# Level visibility controls (defaults seeded in session state so the buttons can set them)
+st.session_state.setdefault("show_connections", True)
+st.session_state.setdefault("show_substages", True)
+st.session_state.setdefault("show_tools", False)
+
 st.sidebar.markdown("### Show/Hide Levels")
-show_connections = st.sidebar.checkbox("Show Connections", value=True)
-show_substages = st.sidebar.checkbox("Show Substages", value=True)
-show_tools = st.sidebar.checkbox("Show Tools", value=False)
+show_connections = st.sidebar.checkbox("Show Connections", key="show_connections")
+show_substages = st.sidebar.checkbox("Show Substages", key="show_substages")
+show_tools = st.sidebar.checkbox("Show Tools", key="show_tools")
+
+# Chart visibility, so the details can be explored without rebuilding the figure
+viz_visible = st.sidebar.checkbox("Show Chart", value=True, key="viz_visible")
 
 # Connection type filter
 if show_connections:
-    connection_type = st.sidebar.multiselect(
+    connection_types = st.sidebar.multiselect(
         "Connection Types to Show",
         ["normal", "alternative"],
-        default=["normal", "alternative"]
+        default=["normal", "alternative"],
+        key="connection_types"
     )
 else:
-    connection_type = []
+    connection_types = []
 
 # Main visualization with control buttons at the top
 st.header("Lifecycle Visualization")
 
-# Add buttons for quick controls
+# Add buttons for quick controls; their callbacks update the widget state
+# before the rerun starts, so the sidebar already shows the new values
 col1, col2, col3, col4 = st.columns(4)
 with col1:
-    if st.button("Show All Levels"):
-        show_connections = True
-        show_substages = True
-        show_tools = True
+    st.button("Show All Levels", on_click=_set_levels, args=(True, True, True))
 with col2:
-    if st.button("Show Stages & Substages"):
-        show_connections = True
-        show_substages = True
-        show_tools = False
+    st.button("Show Stages & Substages", on_click=_set_levels, args=(True, True, False))
 with col3:
-    if st.button("Show Stages Only"):
-        show_connections = True
-        show_substages = False
-        show_tools = False
+    st.button("Show Stages Only", on_click=_set_levels, args=(True, False, False))
 with col4:
-    if st.button("Reset View"):
-        # Reset to default view
-        show_connections = True
-        show_substages = True
-        show_tools = False
-        view_mode = "Complete Lifecycle"
-        selected_stage = None
-        selected_categories = None
-
-# Store session state
-if 'show_connections' not in st.session_state:
-    st.session_state.show_connections = show_connections
-if 'show_substages' not in st.session_state:
-    st.session_state.show_substages = show_substages
-if 'show_tools' not in st.session_state:
-    st.session_state.show_tools = show_tools
-if 'view_mode' not in st.session_state:
-    st.session_state.view_mode = view_mode
-if 'selected_stage' not in st.session_state:
-    st.session_state.selected_stage = selected_stage
-if 'selected_categories' not in st.session_state:
-    st.session_state.selected_categories = selected_categories
-
-# Update session state based on controls
-st.session_state.show_connections = show_connections
-st.session_state.show_substages = show_substages
-st.session_state.show_tools = show_tools
-st.session_state.view_mode = view_mode
-st.session_state.selected_stage = selected_stage
-st.session_state.selected_categories = selected_categories
+    # Reset to default view
+    st.button("Reset View", on_click=_reset_view)
 
 # Explanation of the three-level structure
 with st.expander("How to Read This Visualization", expanded=False):
@@ -185,79 +305,72 @@ with st.expander("How to Read This Visualization", expanded=False):
     - **Dashed lines** show alternative connections or feedback loops
     """)
 
-# Create and display the visualization
-fig = create_lifecycle_visualization(
-    lifecycle_data, 
-    view_mode=st.session_state.view_mode,
-    selected_stage=st.session_state.selected_stage,
-    selected_categories=st.session_state.selected_categories,
-    show_connections=st.session_state.show_connections,
-    show_substages=st.session_state.show_substages,
-    show_tools=st.session_state.show_tools,
-    connection_types=connection_type
-)
+# Create and display the visualization unless it has been hidden
+if viz_visible:
+    fig = _build_fig(
+        view_mode,
+        selected_stage,
+        tuple(selected_categories) if selected_categories is not None else None,
+        show_connections,
+        show_substages,
+        show_tools,
+        tuple(connection_types)
+    )
 
-# Register click events
-config = {
-    'displayModeBar': True,
-    'modeBarButtonsToRemove': ['zoom', 'pan', 'select', 'lasso2d', 'zoomIn', 'zoomOut', 'autoScale', 'resetScale'],
-    'displaylogo': False,
-    'responsive': True
-}
+    # Plotly chart configuration
+    config = {
+        'displayModeBar': True,
+        'modeBarButtonsToRemove': ['zoom', 'pan', 'select', 'lasso2d', 'zoomIn', 'zoomOut', 'autoScale', 'resetScale'],
+        'displaylogo': False,
+        'responsive': True,
+        'staticPlot': False,
+        'doubleClick': 'reset'
+    }
 
-# Display the figure with click handling
-st.plotly_chart(fig, use_container_width=True, config=config)
+    # Display the figure
+    st.plotly_chart(fig, use_container_width=True, config=config)
 
-# Display help text for interactive elements
-st.info("**Interactive Tips**: Click on any stage to focus on it. Use the sidebar controls to customize the view.")
+    # Display help text for interactive elements
+    st.info("**Interactive Tips**: Hover over any segment for details. Use the sidebar controls to focus on a stage or customize the view.")
 
 # Additional information based on view mode
 if view_mode == "Focus on Stage" and selected_stage:
     st.header(f"{selected_stage} Stage Details")
     
     # Find the selected stage data
-    stage_data = next((stage for stage in lifecycle_data["stages"] if stage["name"] == selected_stage), None)
+    stage_data = stages_by_name.get(selected_stage)
     
     if stage_data:
         st.subheader("Description")
         st.write(stage_data["description"])
         
-        # Get categories and tools for this stage
-        stage_tools = {}
-        for exemplar in lifecycle_data["exemplars"]:
-            if exemplar["stage"] == selected_stage:
-                if exemplar["category"] not in stage_tools:
-                    stage_tools[exemplar["category"]] = []
-                stage_tools[exemplar["category"]].append(exemplar)
+        # Get the tools for this stage as one DataFrame
+        exemplars_df = _exemplars_df()
+        stage_df = exemplars_df[exemplars_df["stage"] == selected_stage]
         
         st.subheader("Tool Categories and Exemplars")
         
-        # Display each category in an expander
-        for category, tools in stage_tools.items():
+        # Display each category in an expander, in order of first appearance
+        for category, tools in stage_df.groupby("category", sort=False):
             with st.expander(f"{category} ({len(tools)} tools)", expanded=True):
-                # Create a DataFrame for better display
-                tools_df = pd.DataFrame([{
-                    "Tool Name": tool["name"],
-                    "Description": tool["description"]
-                } for tool in tools])
+                tools_df = tools[["name", "description"]].rename(columns={
+                    "name": "Tool Name",
+                    "description": "Description"
+                }).reset_index(drop=True)
                 
                 st.dataframe(tools_df, use_container_width=True)
 
 elif view_mode == "Compare Tools" and selected_categories:
     st.header("Tool Category Comparison")
     
-    # Create a DataFrame with tools from selected categories
-    tools_data = []
-    for exemplar in lifecycle_data["exemplars"]:
-        if exemplar["category"] in selected_categories:
-            tools_data.append({
-                "Tool Name": exemplar["name"],
-                "Category": exemplar["category"],
-                "Stage": exemplar["stage"],
-                "Description": exemplar["description"]
-            })
-    
-    tools_df = pd.DataFrame(tools_data)
+    # Select tools from the chosen categories
+    exemplars_df = _exemplars_df()
+    tools_df = exemplars_df[exemplars_df["category"].isin(set(selected_categories))].rename(columns={
+        "name": "Tool Name",
+        "category": "Category",
+        "stage": "Stage",
+        "description": "Description"
+    })[["Tool Name", "Category", "Stage", "Description"]].reset_index(drop=True)
     
     # Display grouped by category
     for category in selected_categories:
@@ -271,110 +384,43 @@ elif view_mode == "Compare Tools" and selected_categories:
     
     # Show statistics
     st.subheader("Statistics")
+    
+    # Count tools per category and per stage within selected categories
+    category_counts = tools_df["Category"].value_counts()
+    stage_counts = tools_df["Stage"].value_counts()
+    
+    metrics = [("Total Tools", len(tools_df))]
+    if not stage_counts.empty:
+        metrics.append(("Stages Covered", len(stage_counts)))
+    st.markdown(_metrics_html(metrics), unsafe_allow_html=True)
+    
     col1, col2 = st.columns(2)
     
     with col1:
-        st.metric("Total Tools", len(tools_df))
-        
-        # Count tools per category
-        category_counts = tools_df["Category"].value_counts()
-        
         # Display as a horizontal bar chart
         if not category_counts.empty:
             st.bar_chart(category_counts)
     
     with col2:
-        # Count tools per stage within selected categories
-        stage_counts = tools_df["Stage"].value_counts()
-        
         if not stage_counts.empty:
-            st.metric("Stages Covered", len(stage_counts))
             st.bar_chart(stage_counts)
 else:
     # Overview of lifecycle stages
     st.header("Lifecycle Stages Overview")
     
-    # Create a tabular view of stages and their tools count
-    stage_data = []
-    for stage in lifecycle_data["stages"]:
-        # Count tools for this stage
-        tools_count = len([ex for ex in lifecycle_data["exemplars"] if ex["stage"] == stage["name"]])
-        
-        # Count categories for this stage
-        categories = set(ex["category"] for ex in lifecycle_data["exemplars"] if ex["stage"] == stage["name"])
-        
-        stage_data.append({
-            "Stage": stage["name"],
-            "Description": stage["description"],
-            "Tool Categories": len(categories),
-            "Total Tools": tools_count
-        })
+    stage_data, total_stages, total_categories, total_tools, total_connections = _overview()
     
     # Display as a table
-    st.dataframe(pd.DataFrame(stage_data), use_container_width=True)
+    st.dataframe(stage_data, use_container_width=True)
     
     # Show global statistics
     st.subheader("Global Statistics")
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Total Stages", len(lifecycle_data["stages"]))
-    
-    with col2:
-        total_categories = len(set(ex["category"] for ex in lifecycle_data["exemplars"]))
-        st.metric("Total Tool Categories", total_categories)
-    
-    with col3:
-        st.metric("Total Tools", len(lifecycle_data["exemplars"]))
-    
-    with col4:
-        st.metric("Connections", len(lifecycle_data["connections"]))
-
-# Add JavaScript for click event handling
-st.markdown("""
-<script>
-document.addEventListener('DOMContentLoaded', function() {
-    const plotDiv = document.querySelector('.js-plotly-plot');
-    if (plotDiv) {
-        plotDiv.on('plotly_click', function(data) {
-            const point = data.points[0];
-            const customdata = point.customdata;
-            const meta = point.meta;
-            
-            // Handle click based on segment type
-            if (customdata === 'stage') {
-                // Focus on the stage
-                const stage = meta.stage;
-                if (stage) {
-                    // Use Streamlit's postMessage to communicate with the Python code
-                    window.parent.postMessage({
-                        type: 'streamlit:setComponentValue',
-                        value: {
-                            action: 'focus_stage',
-                            stage: stage
-                        }
-                    }, '*');
-                }
-            } else if (customdata === 'category') {
-                // Focus on the category
-                const stage = meta.stage;
-                const category = meta.category;
-                if (stage && category) {
-                    window.parent.postMessage({
-                        type: 'streamlit:setComponentValue',
-                        value: {
-                            action: 'focus_category',
-                            stage: stage,
-                            category: category
-                        }
-                    }, '*');
-                }
-            }
-        });
-    }
-});
-</script>
-""", unsafe_allow_html=True)
+    st.markdown(_metrics_html([
+        ("Total Stages", total_stages),
+        ("Total Tool Categories", total_categories),
+        ("Total Tools", total_tools),
+        ("Connections", total_connections)
+    ]), unsafe_allow_html=True)
 
 # Footer
 st.markdown("""---
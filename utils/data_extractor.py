@@ -2,32 +2,76 @@
 Data extraction utilities for the MaLDReTH Research Data Lifecycle Visualization.
 """
 
-def extract_categories_by_stage(lifecycle_data):
+from collections import Counter, defaultdict
+from operator import itemgetter
+
+# Color for stages that are missing from the data
+DEFAULT_STAGE_COLOR = "#cccccc"
+
+def build_lookup_tables(lifecycle_data):
     """
-    Extract categories grouped by stage from the lifecycle data.
+    Attach lookup tables derived from the exemplars to the lifecycle data.
+    
+    The tables are built in a single pass and stored under underscore-prefixed
+    keys, where the extract functions below read them instead of re-scanning the
+    exemplars. The exemplar fields are also stored column by column under
+    "_exemplar_columns" for building tables.
+    
+    Args:
+        lifecycle_data (dict): The lifecycle data, updated in place.
+    """
+    exemplars = lifecycle_data["exemplars"]
+    
+    # Column-oriented copy of the exemplar fields
+    exemplar_columns = {
+        field: list(map(itemgetter(field), exemplars))
+        for field in ("stage", "category", "name", "description")
+    }
+    
+    categories_by_stage = defaultdict(set)
+    tools_by_category = defaultdict(list)
+    tool_counts = Counter(exemplar_columns["stage"])
+    
+    for stage_name, category_name, exemplar in zip(
+        exemplar_columns["stage"], exemplar_columns["category"], exemplars
+    ):
+        categories_by_stage[stage_name].add(category_name)
+        tools_by_category[(stage_name, category_name)].append(exemplar)
+    
+    lifecycle_data["_exemplar_columns"] = exemplar_columns
+    lifecycle_data["_categories_by_stage"] = {
+        stage_name: sorted(categories) for stage_name, categories in categories_by_stage.items()
+    }
+    lifecycle_data["_tools_by_category"] = dict(tools_by_category)
+    lifecycle_data["_tool_counts"] = dict(tool_counts)
+    lifecycle_data["_stage_colors"] = {stage["name"]: stage["color"] for stage in lifecycle_data["stages"]}
+
+def _lookup_table(lifecycle_data, key):
+    """
+    Get one of the lookup tables, attaching them first if the data has none yet.
     
     Args:
         lifecycle_data (dict): The lifecycle data.
+        key (str): The key of the table, e.g. "_categories_by_stage".
         
     Returns:
-        dict: A dictionary mapping stage names to lists of categories.
+        The lookup table.
     """
-    categories_by_stage = {}
+    if key not in lifecycle_data:
+        build_lookup_tables(lifecycle_data)
+    return lifecycle_data[key]
+
+def extract_categories_by_stage(lifecycle_data):
+    """
+    Extract categories grouped by stage from the lifecycle data.
     
-    for exemplar in lifecycle_data["exemplars"]:
-        stage_name = exemplar["stage"]
-        category_name = exemplar["category"]
-        
-        if stage_name not in categories_by_stage:
-            categories_by_stage[stage_name] = set()
+    Args:
+        lifecycle_data (dict): The lifecycle data.
         
-        categories_by_stage[stage_name].add(category_name)
-    
-    # Convert sets to sorted lists
-    for stage_name in categories_by_stage:
-        categories_by_stage[stage_name] = sorted(categories_by_stage[stage_name])
-    
-    return categories_by_stage
+    Returns:
+        dict: A dictionary mapping stage names to sorted lists of categories.
+    """
+    return _lookup_table(lifecycle_data, "_categories_by_stage")
 
 def extract_tools_by_category(lifecycle_data):
     """
@@ -37,23 +81,21 @@ def extract_tools_by_category(lifecycle_data):
         lifecycle_data (dict): The lifecycle data.
         
     Returns:
-        dict: A dictionary mapping category names to lists of tools.
+        dict: A dictionary mapping (stage name, category name) pairs to lists of tools.
     """
-    tools_by_category = {}
+    return _lookup_table(lifecycle_data, "_tools_by_category")
+
+def extract_stage_colors(lifecycle_data):
+    """
+    Extract the stage colors from the lifecycle data.
     
-    for exemplar in lifecycle_data["exemplars"]:
-        stage_name = exemplar["stage"]
-        category_name = exemplar["category"]
-        
-        # Create a unique key for each stage-category combination
-        key = f"{stage_name}::{category_name}"
-        
-        if key not in tools_by_category:
-            tools_by_category[key] = []
+    Args:
+        lifecycle_data (dict): The lifecycle data.
         
-        tools_by_category[key].append(exemplar)
-    
-    return tools_by_category
+    Returns:
+        dict: A dictionary mapping stage names to colors.
+    """
+    return _lookup_table(lifecycle_data, "_stage_colors")
 
 def get_stage_color(lifecycle_data, stage_name):
     """
@@ -66,12 +108,8 @@ def get_stage_color(lifecycle_data, stage_name):
     Returns:
         str: The color for the stage, or a default color if not found.
     """
-    for stage in lifecycle_data["stages"]:
-        if stage["name"] == stage_name:
-            return stage["color"]
-    
     # Default color if stage not found
-    return "#cccccc"
+    return extract_stage_colors(lifecycle_data).get(stage_name, DEFAULT_STAGE_COLOR)
 
 def get_stages_with_counts(lifecycle_data):
     """
@@ -88,11 +126,14 @@ def get_stages_with_counts(lifecycle_data):
     # Get categories by stage
     categories_by_stage = extract_categories_by_stage(lifecycle_data)
     
+    # Tools per stage
+    tool_counts = _lookup_table(lifecycle_data, "_tool_counts")
+    
     for stage in lifecycle_data["stages"]:
         stage_name = stage["name"]
         
         # Count tools for this stage
-        tools_count = len([ex for ex in lifecycle_data["exemplars"] if ex["stage"] == stage_name])
+        tools_count = tool_counts.get(stage_name, 0)
         
         # Get categories for this stage
         categories = categories_by_stage.get(stage_name, [])
@@ -4,13 +4,23 @@ Data loading utilities for the MaLDReTH Research Data Lifecycle Visualization.
 
 import json
 import os
+import sys
 import streamlit as st
+from .data_extractor import build_lookup_tables
 
-@st.cache_data
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@st.cache_resource(show_spinner=False)
 def load_lifecycle_data():
     """
     Load lifecycle data from JSON file.
     
+    The same dict is shared by every session and rerun, so callers must treat
+    it as read-only.
+    
     Returns:
         dict: The lifecycle data including stages, connections, and exemplars.
     """
@@ -18,19 +28,50 @@ def load_lifecycle_data():
         # Try to load from the data directory
         data_path = os.path.join("data", "lifecycle_data.json")
         
-        if os.path.exists(data_path):
-            with open(data_path, 'r') as f:
-                return json.load(f)
-        else:
+        try:
+            # orjson works on bytes and is considerably faster than the json module
+            if orjson is not None:
+                with open(data_path, 'rb') as f:
+                    lifecycle_data = orjson.loads(f.read())
+            else:
+                with open(data_path, 'r') as f:
+                    lifecycle_data = json.load(f)
+        except FileNotFoundError:
             # If file doesn't exist, create it with example data
-            example_data = create_example_data()
+            lifecycle_data = create_example_data()
             os.makedirs(os.path.dirname(data_path), exist_ok=True)
-            with open(data_path, 'w') as f:
-                json.dump(example_data, f, indent=2)
-            return example_data
+            if orjson is not None:
+                with open(data_path, 'wb') as f:
+                    f.write(orjson.dumps(lifecycle_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(data_path, 'w') as f:
+                    json.dump(lifecycle_data, f, indent=2)
     except Exception as e:
         st.error(f"Error loading lifecycle data: {str(e)}")
-        return create_example_data()
+        lifecycle_data = create_example_data()
+    
+    # Derive the lookup tables once, after saving, so they are never written to disk
+    _build_indices(lifecycle_data)
+    
+    return lifecycle_data
+
+def _build_indices(lifecycle_data):
+    """
+    Intern the stage and category names and attach the lookup tables.
+    
+    Interning makes every exemplar share one string object per name; the tables
+    come from utils.data_extractor.build_lookup_tables.
+    
+    Args:
+        lifecycle_data (dict): The lifecycle data, updated in place.
+    """
+    for stage in lifecycle_data["stages"]:
+        stage["name"] = sys.intern(stage["name"])
+    for exemplar in lifecycle_data["exemplars"]:
+        exemplar["stage"] = sys.intern(exemplar["stage"])
+        exemplar["category"] = sys.intern(exemplar["category"])
+    
+    build_lookup_tables(lifecycle_data)
 
 def create_example_data():
     """
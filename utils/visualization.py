@@ -5,7 +5,124 @@ Visualization functions for the MaLDReTH Research Data Lifecycle.
 import plotly.graph_objects as go
 import numpy as np
 import math
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from functools import lru_cache
+
+from .data_extractor import DEFAULT_STAGE_COLOR, extract_stage_colors, extract_tools_by_category
+
+# Angular extent and connection anchor point of a stage segment
+StagePosition = namedtuple("StagePosition", ["angle", "start_angle", "end_angle", "x", "y"])
+
+# Number of points per arc; sectors narrower than a stage use proportionally fewer
+_ARC_POINTS = 50
+_MIN_ARC_POINTS = 8
+
+@lru_cache(maxsize=64)
+def _arc_steps(num_points):
+    """
+    Get evenly spaced interpolation steps from 0 to 1.
+    
+    Args:
+        num_points (int): The number of steps.
+        
+    Returns:
+        numpy.ndarray: A read-only array of the steps, shared between calls.
+    """
+    steps = np.linspace(0, 1, num_points)
+    steps.flags.writeable = False
+    return steps
+
+def _num_arc_points(angle, ref_angle=None):
+    """
+    Get the number of arc points for a sector, scaled to its angular width.
+    
+    Args:
+        angle (float): The angular width of the sector in radians.
+        ref_angle (float, optional): The angle that gets the full number of arc points; narrower
+            sectors get proportionally fewer, down to a minimum. Defaults to None, which always
+            uses the full number.
+        
+    Returns:
+        int: The number of points per arc.
+    """
+    if not ref_angle:
+        return _ARC_POINTS
+    return min(_ARC_POINTS, max(_MIN_ARC_POINTS, int(_ARC_POINTS * angle / ref_angle)))
+
+# Decimal places kept for coordinates in merged traces, a small fraction of a pixel
+# on the 800 pixel wide figure
+_COORD_DECIMALS = 4
+
+def _rounded(values):
+    """
+    Round coordinates for a merged trace.
+    
+    Merged traces are serialized as JSON lists, so shorter numbers make a smaller figure.
+    
+    Args:
+        values (array-like): The coordinates to round.
+        
+    Returns:
+        list: The coordinates rounded to _COORD_DECIMALS decimal places.
+    """
+    return np.round(values, _COORD_DECIMALS).tolist()
+
+def _single_precision(values):
+    """
+    Convert the coordinates of a standalone trace to single precision.
+    
+    Plotly sends NumPy arrays to the browser as binary, so float32 halves their size
+    while staying far more precise than a pixel.
+    
+    Args:
+        values (numpy.ndarray): The coordinates to convert.
+        
+    Returns:
+        numpy.ndarray: The coordinates as float32.
+    """
+    return values.astype(np.float32)
+
+# Interpolation steps shared by every connection and curve
+_ARC_STEPS = _arc_steps(_ARC_POINTS)
+
+# Quadratic Bezier weights of the start, control and end points at each step
+_BEZIER_START = (1 - _ARC_STEPS)**2
+_BEZIER_CONTROL = 2 * (1 - _ARC_STEPS) * _ARC_STEPS
+_BEZIER_END = _ARC_STEPS**2
+
+# Hover label style of every trace
+_TRACE_HOVERLABEL = dict(
+    bgcolor="white",
+    font=dict(size=12),
+    bordercolor="#cccccc"
+)
+
+# Layout shared by every lifecycle figure; shapes and annotations are added per figure.
+# go.Figure copies it, so it is never modified.
+_BASE_LAYOUT = dict(
+    showlegend=False,
+    plot_bgcolor="white",
+    hovermode="closest",
+    uirevision="lifecycle",  # Keep the client-side view state across reruns
+    margin=dict(l=20, r=20, t=20, b=20),
+    width=800,
+    height=800,
+    xaxis=dict(
+        visible=False,
+        range=[-1, 1]
+    ),
+    yaxis=dict(
+        visible=False,
+        range=[-1, 1],
+        scaleanchor="x",
+        scaleratio=1
+    ),
+    hoverlabel=dict(
+        bgcolor="white",
+        font=dict(size=12, family="Arial"),
+        bordercolor="#cccccc"
+    )
+)
 
 def create_lifecycle_visualization(
     lifecycle_data, 
@@ -15,7 +132,8 @@ def create_lifecycle_visualization(
     show_connections=True,
     show_substages=True,
     show_tools=False,
-    connection_types=["normal", "alternative"]
+    connection_types=["normal", "alternative"],
+    use_webgl=False
 ):
     """
     Create a three-level circular visualization of the MaLDReTH Research Data Lifecycle.
@@ -29,6 +147,7 @@ def create_lifecycle_visualization(
         show_substages (bool): Whether to show substages.
         show_tools (bool): Whether to show tools.
         connection_types (list): The types of connections to show.
+        use_webgl (bool): Whether to render sectors, connection lines and arrowheads with WebGL.
         
     Returns:
         plotly.graph_objects.Figure: The visualization figure.
@@ -49,70 +168,52 @@ def create_lifecycle_visualization(
         "tool_opacity": 0.7
     }
     
-    # Create figure
-    fig = go.Figure()
-    
-    # Add center circle
-    fig.add_shape(
-        type="circle",
-        x0=-config["center_radius"],
-        y0=-config["center_radius"],
-        x1=config["center_radius"],
-        y1=config["center_radius"],
-        fillcolor="#f8f8f8",
-        line_color="#dddddd",
-        line_width=2,
-        layer="below"
-    )
-    
-    # Add separator rings
-    fig.add_shape(
-        type="circle",
-        x0=-(config["inner_radius"] - config["ring_padding"]/2),
-        y0=-(config["inner_radius"] - config["ring_padding"]/2),
-        x1=(config["inner_radius"] - config["ring_padding"]/2),
-        y1=(config["inner_radius"] - config["ring_padding"]/2),
-        fillcolor="rgba(0,0,0,0)",
-        line_color="#dddddd",
-        line_width=1,
-        layer="below"
-    )
-    
-    fig.add_shape(
-        type="circle",
-        x0=-(config["middle_radius"] - config["ring_padding"]/2),
-        y0=-(config["middle_radius"] - config["ring_padding"]/2),
-        x1=(config["middle_radius"] - config["ring_padding"]/2),
-        y1=(config["middle_radius"] - config["ring_padding"]/2),
-        fillcolor="rgba(0,0,0,0)",
-        line_color="#dddddd",
-        line_width=1,
-        layer="below"
-    )
-    
-    fig.add_shape(
-        type="circle",
-        x0=-(config["outer_radius"] + config["ring_padding"]/2),
-        y0=-(config["outer_radius"] + config["ring_padding"]/2),
-        x1=(config["outer_radius"] + config["ring_padding"]/2),
-        y1=(config["outer_radius"] + config["ring_padding"]/2),
-        fillcolor="rgba(0,0,0,0)",
-        line_color="#dddddd",
-        line_width=1,
-        layer="below"
-    )
+    # Traces, shapes and annotations are collected as plain dicts and turned
+    # into a figure once at the end
+    traces = []
+    annotations = []
+    
+    # Center circle and separator rings
+    shapes = [
+        dict(
+            type="circle",
+            x0=-config["center_radius"],
+            y0=-config["center_radius"],
+            x1=config["center_radius"],
+            y1=config["center_radius"],
+            fillcolor="#f8f8f8",
+            line=dict(color="#dddddd", width=2),
+            layer="below"
+        )
+    ]
+    for ring_radius in (
+        config["inner_radius"] - config["ring_padding"]/2,
+        config["middle_radius"] - config["ring_padding"]/2,
+        config["outer_radius"] + config["ring_padding"]/2
+    ):
+        shapes.append(dict(
+            type="circle",
+            x0=-ring_radius,
+            y0=-ring_radius,
+            x1=ring_radius,
+            y1=ring_radius,
+            fillcolor="rgba(0,0,0,0)",
+            line=dict(color="#dddddd", width=1),
+            layer="below"
+        ))
     
     # Add center text
-    fig.add_annotation(
+    annotations.append(dict(
         x=0, y=0,
         text="MaLDReTH<br>Research Data<br>Lifecycle",
         showarrow=False,
         font=dict(size=14, color="#333", family="Arial"),
         align="center"
-    )
+    ))
     
     # Get stages
     stages = lifecycle_data["stages"]
+    stage_colors = extract_stage_colors(lifecycle_data)
     
     # Separate Fund from main cycle stages
     fund_stage = None
@@ -140,17 +241,19 @@ def create_lifecycle_visualization(
         fund_angle_start = -math.pi/4  # Position in the upper right
         fund_angle_end = fund_angle_start + math.pi/2  # Cover 90 degrees
         
-        # Middle angle for Fund
+        # Middle angle for Fund, shared by its position and label
         fund_middle_angle = (fund_angle_start + fund_angle_end) / 2
+        cos_fund = math.cos(fund_middle_angle)
+        sin_fund = math.sin(fund_middle_angle)
         
         # Store Fund position
-        stage_positions[fund_stage["name"]] = {
-            "angle": fund_middle_angle,
-            "start_angle": fund_angle_start,
-            "end_angle": fund_angle_end,
-            "x": config["fund_radius"] * math.cos(fund_middle_angle),
-            "y": config["fund_radius"] * math.sin(fund_middle_angle)
-        }
+        stage_positions[fund_stage["name"]] = StagePosition(
+            angle=fund_middle_angle,
+            start_angle=fund_angle_start,
+            end_angle=fund_angle_end,
+            x=config["fund_radius"] * cos_fund,
+            y=config["fund_radius"] * sin_fund
+        )
         
         # Inner radius with padding for Fund
         r_inner = config["center_radius"] + config["ring_padding"]
@@ -159,7 +262,7 @@ def create_lifecycle_visualization(
         
         # Draw Fund segment
         draw_sector(
-            fig, 
+            traces, 
             fund_angle_start, 
             fund_angle_end,
             r_inner, 
@@ -168,80 +271,93 @@ def create_lifecycle_visualization(
             opacity=config["stage_opacity"],
             hover_text=f"<b>{fund_stage['name']}</b><br>{fund_stage['description']}",
             stage_name=fund_stage['name'],
-            segment_type="stage"
+            segment_type="stage",
+            use_webgl=use_webgl,
+            ref_angle=stage_angle
         )
         
         # Add Fund label
         label_angle = fund_middle_angle
         label_radius = (r_inner + r_outer) / 2
-        label_x = label_radius * math.cos(label_angle)
-        label_y = label_radius * math.sin(label_angle)
+        label_x = label_radius * cos_fund
+        label_y = label_radius * sin_fund
         
         # Adjust text angle for readability
         text_angle = (label_angle * 180 / math.pi)
         if label_angle > math.pi/2 and label_angle < 3*math.pi/2:
             text_angle -= 180
             
-        fig.add_annotation(
+        annotations.append(dict(
             x=label_x, y=label_y,
             text=fund_stage["name"],
             showarrow=False,
             textangle=text_angle,
             font=dict(size=12, color="#333", family="Arial"),
             align="center"
-        )
+        ))
     
-    # Prepare data structures for categories and tools
+    # Tool exemplars grouped by (stage, category), reusing the table built at load time
+    tools_by_category = extract_tools_by_category(lifecycle_data)
+    selected_set = set(selected_categories or ())
+    
+    # Categories of each stage, in the order their first tool appears
     categories_by_stage = defaultdict(list)
-    tools_by_category = defaultdict(list)
+    for category_key in tools_by_category:
+        categories_by_stage[category_key[0]].append({
+            "name": category_key[1],
+            "key": category_key
+        })
+    
+    # Calculate the angles of all main cycle stages at once
+    angle_starts = start_angle + np.arange(num_stages) * stage_angle
+    angle_ends = angle_starts + stage_angle - config["padding_angle"]
+    middle_angles = (angle_starts + angle_ends) / 2
+    cos_middles = np.cos(middle_angles)
+    sin_middles = np.sin(middle_angles)
+    
+    # Label angles follow the arc, turned half a circle on the left so the text stays upright
+    text_angles = middle_angles * 180 / math.pi
+    text_angles = np.where(
+        (middle_angles > math.pi/2) & (middle_angles < 3*math.pi/2),
+        text_angles - 180,
+        text_angles
+    )
     
-    # Group tool exemplars by stage and category
-    for exemplar in lifecycle_data["exemplars"]:
-        stage_name = exemplar["stage"]
-        category_name = exemplar["category"]
-        
-        # Create a unique category key
-        category_key = f"{stage_name}::{category_name}"
-        
-        # Add category to list if not already there
-        if category_name not in [c["name"] for c in categories_by_stage[stage_name]]:
-            categories_by_stage[stage_name].append({
-                "name": category_name,
-                "key": category_key
-            })
-        
-        # Add tool to category
-        tools_by_category[category_key].append(exemplar)
+    # Inner and outer radius of the stage ring, with padding
+    r_inner = config["fund_radius"] + config["ring_padding"]
+    r_outer = config["inner_radius"] - config["ring_padding"]
+    
+    # Positions used for connections and labels
+    position_radius = config["inner_radius"] + config["ring_padding"]
+    label_radius = (r_inner + r_outer) / 2
     
     # Draw main cycle stages
-    for i, stage in enumerate(main_cycle_stages):
-        # Calculate angles for this stage
-        angle_start = start_angle + i * stage_angle
-        angle_end = angle_start + stage_angle - config["padding_angle"]
-        
+    for stage, angle_start, angle_end, middle_angle, cos_middle, sin_middle, text_angle in zip(
+        main_cycle_stages,
+        angle_starts.tolist(),
+        angle_ends.tolist(),
+        middle_angles.tolist(),
+        cos_middles.tolist(),
+        sin_middles.tolist(),
+        text_angles.tolist()
+    ):
         # Store middle point angle for connections
-        middle_angle = (angle_start + angle_end) / 2
-        stage_positions[stage["name"]] = {
-            "angle": middle_angle,
-            "start_angle": angle_start,
-            "end_angle": angle_end,
-            "x": (config["inner_radius"] + config["ring_padding"]) * math.cos(middle_angle),
-            "y": (config["inner_radius"] + config["ring_padding"]) * math.sin(middle_angle)
-        }
+        stage_positions[stage["name"]] = StagePosition(
+            angle=middle_angle,
+            start_angle=angle_start,
+            end_angle=angle_end,
+            x=position_radius * cos_middle,
+            y=position_radius * sin_middle
+        )
         
         # Determine opacity based on view mode
         opacity = config["stage_opacity"]
         if view_mode == "Focus on Stage" and stage["name"] != selected_stage:
             opacity = 0.4
         
-        # Inner radius with padding
-        r_inner = config["fund_radius"] + config["ring_padding"]
-        # Outer radius with padding
-        r_outer = config["inner_radius"] - config["ring_padding"]
-        
         # Draw stage segment
         draw_sector(
-            fig, 
+            traces, 
             angle_start, 
             angle_end,
             r_inner, 
@@ -250,110 +366,126 @@ def create_lifecycle_visualization(
             opacity=opacity,
             hover_text=f"<b>{stage['name']}</b><br>{stage['description']}",
             stage_name=stage['name'],
-            segment_type="stage"
+            segment_type="stage",
+            use_webgl=use_webgl,
+            ref_angle=stage_angle
         )
         
         # Add stage label aligned to the arc
-        label_angle = middle_angle
-        label_radius = (r_inner + r_outer) / 2
-        label_x = label_radius * math.cos(label_angle)
-        label_y = label_radius * math.sin(label_angle)
+        label_x = label_radius * cos_middle
+        label_y = label_radius * sin_middle
         
-        # Adjust text angle to follow the arc
-        text_angle = (label_angle * 180 / math.pi)
-        if label_angle > math.pi/2 and label_angle < 3*math.pi/2:
-            text_angle -= 180
-            
-        fig.add_annotation(
+        annotations.append(dict(
             x=label_x, y=label_y,
             text=stage["name"],
             showarrow=False,
             textangle=text_angle,
             font=dict(size=11, color="#333", family="Arial"),
             align="center"
-        )
+        ))
     
     # Draw substages (middle ring) if enabled
     if show_substages:
         for stage_name, stage_pos in stage_positions.items():
-            stage_color = next((s["color"] for s in stages if s["name"] == stage_name), "#ccc")
+            stage_color = stage_colors.get(stage_name, DEFAULT_STAGE_COLOR)
+            
+            # Category and tool sectors use lighter shades of the stage color
+            category_color = lighten_color(stage_color, 0.1)
+            tool_color = lighten_color(stage_color, 0.2)
             categories = categories_by_stage[stage_name]
             num_categories = len(categories)
             
             if num_categories > 0:
                 # Calculate angle for each category
-                category_angle = (stage_pos["end_angle"] - stage_pos["start_angle"]) / num_categories
+                category_angle = (stage_pos.end_angle - stage_pos.start_angle) / num_categories
                 
-                for j, category in enumerate(categories):
-                    # Calculate angles for this category
-                    cat_angle_start = stage_pos["start_angle"] + j * category_angle
-                    cat_angle_end = cat_angle_start + category_angle - config["padding_angle"]
-                    
-                    # Store category position
-                    middle_cat_angle = (cat_angle_start + cat_angle_end) / 2
-                    category["angle"] = middle_cat_angle
-                    category["start_angle"] = cat_angle_start
-                    category["end_angle"] = cat_angle_end
-                    
-                    # Determine opacity
+                # Calculate the angles of all categories of this stage at once
+                cat_angle_starts = stage_pos.start_angle + np.arange(num_categories) * category_angle
+                cat_angle_ends = cat_angle_starts + category_angle - config["padding_angle"]
+                middle_cat_angles = (cat_angle_starts + cat_angle_ends) / 2
+                
+                # Label angles follow the arc, turned half a circle on the left so the text stays upright
+                cat_text_angles = middle_cat_angles * 180 / math.pi
+                cat_text_angles = np.where(
+                    (middle_cat_angles > math.pi/2) & (middle_cat_angles < 3*math.pi/2),
+                    cat_text_angles - 180,
+                    cat_text_angles
+                )
+                
+                # Determine opacity of each category
+                cat_opacities = []
+                for category in categories:
                     opacity = config["substage_opacity"]
                     if view_mode == "Focus on Stage" and stage_name != selected_stage:
                         opacity = 0.3
-                    elif view_mode == "Compare Tools" and selected_categories:
-                        if category["name"] not in selected_categories:
+                    elif view_mode == "Compare Tools" and selected_set:
+                        if category["name"] not in selected_set:
                             opacity = 0.3
-                    
-                    # Inner radius with padding
-                    r_inner = config["inner_radius"] + config["ring_padding"]
-                    # Outer radius with padding
-                    r_outer = config["middle_radius"] - config["ring_padding"]
+                    cat_opacities.append(opacity)
+                
+                # Inner radius with padding
+                cat_r_inner = config["inner_radius"] + config["ring_padding"]
+                # Outer radius with padding
+                cat_r_outer = config["middle_radius"] - config["ring_padding"]
+                
+                cat_hover_texts = [f"<b>{category['name']}</b><br>Stage: {stage_name}" for category in categories]
+                
+                for category, cat_angle_start, cat_angle_end, middle_cat_angle, text_angle, opacity, hover_text in zip(
+                    categories,
+                    cat_angle_starts.tolist(),
+                    cat_angle_ends.tolist(),
+                    middle_cat_angles.tolist(),
+                    cat_text_angles.tolist(),
+                    cat_opacities,
+                    cat_hover_texts
+                ):
+                    # Store category position
+                    category["angle"] = middle_cat_angle
+                    category["start_angle"] = cat_angle_start
+                    category["end_angle"] = cat_angle_end
                     
                     # Draw category segment
                     draw_sector(
-                        fig, 
+                        traces, 
                         cat_angle_start, 
                         cat_angle_end,
-                        r_inner, 
-                        r_outer,
-                        lighten_color(stage_color, 0.1),
+                        cat_r_inner, 
+                        cat_r_outer,
+                        category_color,
                         opacity=opacity,
-                        hover_text=f"<b>{category['name']}</b><br>Stage: {stage_name}",
+                        hover_text=hover_text,
                         stage_name=stage_name,
                         category_name=category['name'],
-                        segment_type="category"
+                        segment_type="category",
+                        use_webgl=use_webgl,
+                        ref_angle=stage_angle
                     )
                     
-                    # Add category label for important categories
-                    if ((view_mode == "Complete Lifecycle") or 
+                    # Add category label for important categories, only if there's enough space
+                    if category_angle > 0.15 and (  # Minimum angle for labels
+                        (view_mode == "Complete Lifecycle") or 
                         (view_mode == "Focus on Stage" and stage_name == selected_stage) or
                         (view_mode == "Compare Tools" and 
-                         (not selected_categories or category["name"] in selected_categories))):
+                         (not selected_set or category["name"] in selected_set))):
                         
-                        label_radius = (r_inner + r_outer) / 2
+                        label_radius = (cat_r_inner + cat_r_outer) / 2
                         label_x = label_radius * math.cos(middle_cat_angle)
                         label_y = label_radius * math.sin(middle_cat_angle)
                         
-                        # Adjust text angle to follow the arc
-                        text_angle = (middle_cat_angle * 180 / math.pi)
-                        if middle_cat_angle > math.pi/2 and middle_cat_angle < 3*math.pi/2:
-                            text_angle -= 180
-                        
                         # Shortened category name if too long
                         display_name = category["name"]
                         if len(display_name) > 12:
                             display_name = display_name[:10] + "..."
                             
                         # Add the label
-                        # Only add labels if there's enough space
-                        if category_angle > 0.15:  # Minimum angle for labels
-                            fig.add_annotation(
-                                x=label_x, y=label_y,
-                                text=display_name,
-                                showarrow=False,
-                                textangle=text_angle,
-                                font=dict(size=9, color="#333"),
-                                align="center"
-                            )
+                        annotations.append(dict(
+                            x=label_x, y=label_y,
+                            text=display_name,
+                            showarrow=False,
+                            textangle=text_angle,
+                            font=dict(size=9, color="#333"),
+                            align="center"
+                        ))
                     
                     # Draw tools (outer ring) for this category if enabled
                     if show_tools:
@@ -364,38 +496,53 @@ def create_lifecycle_visualization(
                             # Calculate angle for each tool
                             tool_angle = (cat_angle_end - cat_angle_start) / num_tools
                             
-                            for k, tool in enumerate(tools):
-                                # Calculate angles for this tool
-                                tool_angle_start = cat_angle_start + k * tool_angle
-                                tool_angle_end = tool_angle_start + tool_angle - config["padding_angle"]
-                                
-                                # Determine opacity
-                                opacity = config["tool_opacity"]
-                                if view_mode == "Focus on Stage" and stage_name != selected_stage:
+                            # Angles of all tools in this category
+                            tool_angle_starts = cat_angle_start + np.arange(num_tools) * tool_angle
+                            tool_angle_ends = tool_angle_starts + tool_angle - config["padding_angle"]
+                            
+                            # Determine opacity
+                            opacity = config["tool_opacity"]
+                            if view_mode == "Focus on Stage" and stage_name != selected_stage:
+                                opacity = 0.2
+                            elif view_mode == "Compare Tools" and selected_set:
+                                if category["name"] not in selected_set:
                                     opacity = 0.2
-                                elif view_mode == "Compare Tools" and selected_categories:
-                                    if category["name"] not in selected_categories:
-                                        opacity = 0.2
-                                
-                                # Inner radius with padding
-                                r_inner = config["middle_radius"] + config["ring_padding"]
-                                # Outer radius with padding
-                                r_outer = config["outer_radius"] - config["ring_padding"]
-                                
+                            
+                            # Inner radius with padding
+                            r_inner = config["middle_radius"] + config["ring_padding"]
+                            # Outer radius with padding
+                            r_outer = config["outer_radius"] - config["ring_padding"]
+                            
+                            # Dimmed tools get no hover text, which is not worth formatting for them
+                            dimmed = opacity < config["tool_opacity"]
+                            
+                            if dimmed:
+                                hover_texts = [None] * num_tools
+                            else:
+                                hover_texts = [
+                                    f"<b>{tool['name']}</b><br>{tool['description']}<br>Category: {category['name']}<br>Stage: {stage_name}"
+                                    for tool in tools
+                                ]
+                            
+                            for tool, tool_angle_start, tool_angle_end, hover_text in zip(
+                                tools, tool_angle_starts.tolist(), tool_angle_ends.tolist(), hover_texts
+                            ):
                                 # Draw tool segment
                                 draw_sector(
-                                    fig, 
+                                    traces, 
                                     tool_angle_start, 
                                     tool_angle_end,
                                     r_inner, 
                                     r_outer,
-                                    lighten_color(stage_color, 0.2),
+                                    tool_color,
                                     opacity=opacity,
-                                    hover_text=f"<b>{tool['name']}</b><br>{tool['description']}<br>Category: {category['name']}<br>Stage: {stage_name}",
+                                    hover_text=hover_text,
                                     stage_name=stage_name,
                                     category_name=category['name'],
                                     tool_name=tool['name'],
-                                    segment_type="tool"
+                                    segment_type="tool",
+                                    use_webgl=use_webgl,
+                                    ref_angle=stage_angle
                                 )
     
     # Draw connections between stages if enabled
@@ -403,6 +550,14 @@ def create_lifecycle_visualization(
         # Draw connection between stages and substages
         arrow_radius = (config["inner_radius"] + config["ring_padding"] * 2)
         
+        # Connection lines are collected per style and emitted as one trace each,
+        # and all arrowheads as a single filled trace
+        connection_lines = defaultdict(lambda: {"x": [], "y": [], "text": []})
+        connection_arrows = {"x": [], "y": []}
+        
+        # Arcs between stages are gathered per line style and computed in one pass each
+        connection_arcs = defaultdict(lambda: {"from": [], "to": [], "text": []})
+        
         # First, draw normal connections in the main cycle
         for connection in lifecycle_data["connections"]:
             if connection["type"] in connection_types:
@@ -415,16 +570,13 @@ def create_lifecycle_visualization(
                 
                 # Determine line style based on connection type
                 line_dash = "solid" if connection["type"] == "normal" else "dash"
+                line_width = 2 if connection["type"] == "normal" else 1.5
                 
-                # Draw connection line with appropriate styling
-                draw_connection(
-                    fig,
-                    from_pos["angle"],
-                    to_pos["angle"],
-                    arrow_radius,  # Radius for connections (between stages and substages)
-                    line_type=line_dash,
-                    line_width=2 if connection["type"] == "normal" else 1.5,
-                    hover_text=f"Connection: {connection['from']} → {connection['to']}<br>Type: {connection['type']}"
+                arcs = connection_arcs[(line_dash, line_width)]
+                arcs["from"].append(from_pos.angle)
+                arcs["to"].append(to_pos.angle)
+                arcs["text"].append(
+                    f"Connection: {connection['from']} → {connection['to']}<br>Type: {connection['type']}"
                 )
         
         # Add the special return connections (Store → Analyse, Analyse → Process, Process → Collect)
@@ -439,16 +591,24 @@ def create_lifecycle_visualization(
                 from_pos = stage_positions[conn["from"]]
                 to_pos = stage_positions[conn["to"]]
                 
-                # Draw dashed return connection
-                draw_connection(
-                    fig,
-                    from_pos["angle"],
-                    to_pos["angle"],
-                    arrow_radius,
-                    line_type="dash",
-                    line_width=1.5,
-                    hover_text=f"Return connection: {conn['from']} → {conn['to']}"
-                )
+                # Dashed return connection
+                arcs = connection_arcs[("dash", 1.5)]
+                arcs["from"].append(from_pos.angle)
+                arcs["to"].append(to_pos.angle)
+                arcs["text"].append(f"Return connection: {conn['from']} → {conn['to']}")
+        
+        # Draw the gathered arcs with their arrowheads
+        for (line_type, line_width), arcs in connection_arcs.items():
+            append_connections(
+                connection_lines,
+                connection_arrows,
+                arcs["from"],
+                arcs["to"],
+                arrow_radius,  # Radius for connections (between stages and substages)
+                line_type,
+                line_width,
+                arcs["text"]
+            )
         
         # Add connections to/from Fund
         if "Fund" in stage_positions:
@@ -469,19 +629,20 @@ def create_lifecycle_visualization(
                     # For connections to/from Fund, use custom curved connections
                     if conn["from"] == "Fund" or conn["to"] == "Fund":
                         # Calculate points for a curved line
-                        from_x = config["fund_radius"] * math.cos(from_pos["angle"])
-                        from_y = config["fund_radius"] * math.sin(from_pos["angle"])
+                        from_x = config["fund_radius"] * math.cos(from_pos.angle)
+                        from_y = config["fund_radius"] * math.sin(from_pos.angle)
                         
-                        to_x = config["inner_radius"] * math.cos(to_pos["angle"]) 
-                        to_y = config["inner_radius"] * math.sin(to_pos["angle"])
+                        to_x = config["inner_radius"] * math.cos(to_pos.angle) 
+                        to_y = config["inner_radius"] * math.sin(to_pos.angle)
                         
                         # Calculate control point (mid-point with offset)
                         mid_x = (from_x + to_x) / 2
                         mid_y = (from_y + to_y) / 2
                         
-                        # Draw custom curved line
-                        draw_custom_curve(
-                            fig,
+                        # Add custom curved line
+                        append_custom_curve(
+                            connection_lines,
+                            connection_arrows,
                             from_x, from_y,
                             to_x, to_y,
                             mid_x, mid_y,
@@ -489,53 +650,28 @@ def create_lifecycle_visualization(
                             line_width=1.5,
                             hover_text=f"Connection: {conn['from']} → {conn['to']}"
                         )
-    
-    # Configure the layout
-    fig.update_layout(
-        showlegend=False,
-        plot_bgcolor="white",
-        margin=dict(l=20, r=20, t=20, b=20),
-        width=800,
-        height=800,
-        shapes=[],
-        annotations=[],
-        xaxis=dict(
-            visible=False,
-            range=[-1, 1]
-        ),
-        yaxis=dict(
-            visible=False,
-            range=[-1, 1],
-            scaleanchor="x",
-            scaleratio=1
-        ),
-        hoverlabel=dict(
-            bgcolor="white",
-            font_size=12,
-            font_family="Arial",
-            bordercolor="#cccccc"
-        )
-    )
+        
+        add_line_traces(traces, connection_lines, use_webgl=use_webgl)
+        add_arrow_trace(traces, connection_arrows, use_webgl=use_webgl)
     
     # Enable hover information with better formatting
-    fig.update_traces(
-        hovertemplate="<b>%{text}</b>",
-        hoverlabel=dict(
-            bgcolor="white",
-            font_size=12,
-            bordercolor="#cccccc"
-        )
-    )
+    for trace in traces:
+        trace.setdefault("hovertemplate", "<b>%{text}</b>")
+        trace["hoverlabel"] = _TRACE_HOVERLABEL
     
-    return fig
+    # Configure the layout
+    layout = dict(_BASE_LAYOUT, shapes=shapes, annotations=annotations)
+    
+    return go.Figure(dict(data=traces, layout=layout))
 
-def draw_sector(fig, angle_start, angle_end, r_inner, r_outer, color, opacity=0.8, 
-                hover_text=None, stage_name=None, category_name=None, tool_name=None, segment_type=None):
+def draw_sector(traces, angle_start, angle_end, r_inner, r_outer, color, opacity=0.8, 
+                hover_text=None, stage_name=None, category_name=None, tool_name=None, segment_type=None,
+                use_webgl=False, ref_angle=None):
     """
     Draw a sector in the circular visualization.
     
     Args:
-        fig (plotly.graph_objects.Figure): The figure to add the sector to.
+        traces (list): The trace list to add the sector to.
         angle_start (float): The starting angle in radians.
         angle_end (float): The ending angle in radians.
         r_inner (float): The inner radius.
@@ -547,35 +683,46 @@ def draw_sector(fig, angle_start, angle_end, r_inner, r_outer, color, opacity=0.
         category_name (str, optional): The name of the category. Defaults to None.
         tool_name (str, optional): The name of the tool. Defaults to None.
         segment_type (str, optional): The type of segment ("stage", "category", or "tool"). Defaults to None.
+        use_webgl (bool, optional): Whether to draw the sector as a WebGL trace. Defaults to False.
+        ref_angle (float, optional): The angle that gets the full number of arc points; narrower
+            sectors get proportionally fewer, down to a minimum. Defaults to None, which always
+            uses the full number.
     """
+    # Scale the number of arc points to the width of the sector
+    num_points = _num_arc_points(angle_end - angle_start, ref_angle)
+    
     # Generate points for the sector
-    theta = np.linspace(angle_start, angle_end, 50)
+    theta = angle_start + _arc_steps(num_points) * (angle_end - angle_start)
+    cos_theta = np.cos(theta)
+    sin_theta = np.sin(theta)
     
-    # Inner arc points (in reverse to create a closed shape)
-    x_inner = r_inner * np.cos(theta[::-1])
-    y_inner = r_inner * np.sin(theta[::-1])
+    # Fill one buffer per axis: outer arc, inner arc in reverse, then the first
+    # point again to close the shape
+    x = np.empty(2 * num_points + 1)
+    y = np.empty(2 * num_points + 1)
     
     # Outer arc points
-    x_outer = r_outer * np.cos(theta)
-    y_outer = r_outer * np.sin(theta)
+    np.multiply(cos_theta, r_outer, out=x[:num_points])
+    np.multiply(sin_theta, r_outer, out=y[:num_points])
     
-    # Combine to form a closed shape
-    x = np.concatenate([x_outer, x_inner, [x_outer[0]]])
-    y = np.concatenate([y_outer, y_inner, [y_outer[0]]])
+    # Inner arc points (in reverse to create a closed shape)
+    np.multiply(cos_theta[::-1], r_inner, out=x[num_points:-1])
+    np.multiply(sin_theta[::-1], r_inner, out=y[num_points:-1])
     
-    # Create custom data for click events
-    customdata = np.full(len(x), segment_type)
+    x[-1] = x[0]
+    y[-1] = y[0]
     
-    # Add to figure
-    fig.add_trace(go.Scatter(
-        x=x, y=y,
+    # Add to the trace list
+    trace_type = "scattergl" if use_webgl else "scatter"
+    traces.append(dict(
+        type=trace_type,
+        x=_single_precision(x), y=_single_precision(y),
         fill="toself",
         fillcolor=color,
         opacity=opacity,
         line=dict(color="white", width=1),
-        hoverinfo="text" if hover_text else "none",
+        hoverinfo="text" if hover_text else "skip",
         text=hover_text,
-        customdata=customdata,
         showlegend=False,
         meta={
             "type": segment_type,
@@ -586,77 +733,13 @@ def draw_sector(fig, angle_start, angle_end, r_inner, r_outer, color, opacity=0.
         name=f"{stage_name or ''}-{category_name or ''}-{tool_name or ''}"
     ))
 
-def draw_connection(fig, angle1, angle2, radius, line_type="solid", line_width=1.5, hover_text=None):
-    """
-    Draw a connection between two points on the circle.
-    
-    Args:
-        fig (plotly.graph_objects.Figure): The figure to add the connection to.
-        angle1 (float): The starting angle in radians.
-        angle2 (float): The ending angle in radians.
-        radius (float): The radius of the circle.
-        line_type (str, optional): The type of line ("solid" or "dash"). Defaults to "solid".
-        line_width (float, optional): The width of the line. Defaults to 1.5.
-        hover_text (str, optional): The hover text for the connection. Defaults to None.
-    """
-    # Ensure angles are in the right order for the shortest path
-    if abs(angle2 - angle1) > math.pi:
-        if angle1 < angle2:
-            angle1 += 2 * math.pi
-        else:
-            angle2 += 2 * math.pi
-    
-    # Number of points to interpolate
-    num_points = 50
-    
-    # Create angles for the arc
-    theta = np.linspace(angle1, angle2, num_points)
-    
-    # Calculate points on the arc
-    x = radius * np.cos(theta)
-    y = radius * np.sin(theta)
-    
-    # Draw the connection
-    fig.add_trace(go.Scatter(
-        x=x, y=y,
-        mode="lines",
-        line=dict(
-            color="#555",
-            width=line_width,
-            dash="dash" if line_type == "dash" else "solid"
-        ),
-        hoverinfo="text" if hover_text else "none",
-        text=hover_text,
-        showlegend=False
-    ))
-    
-    # Add an arrow at the end
-    last_angle = theta[-1]
-    arrow_angle = last_angle + math.pi / 2  # Perpendicular to the tangent
-    
-    arrow_length = 0.025
-    arrow_x = [x[-1], 
-               x[-1] + arrow_length * math.cos(arrow_angle + math.pi/8), 
-               x[-1] + arrow_length * math.cos(arrow_angle - math.pi/8)]
-    arrow_y = [y[-1], 
-               y[-1] + arrow_length * math.sin(arrow_angle + math.pi/8), 
-               y[-1] + arrow_length * math.sin(arrow_angle - math.pi/8)]
-    
-    fig.add_trace(go.Scatter(
-        x=arrow_x, y=arrow_y,
-        fill="toself",
-        fillcolor="#555",
-        line=dict(color="#555"),
-        hoverinfo="none",
-        showlegend=False
-    ))
-
-def draw_custom_curve(fig, x1, y1, x2, y2, cx, cy, line_type="solid", line_width=1.5, hover_text=None):
+def append_custom_curve(lines, arrows, x1, y1, x2, y2, cx, cy, line_type="solid", line_width=1.5, hover_text=None):
     """
-    Draw a custom curved connection between two points.
+    Append a custom curved connection between two points, with its arrowhead, to the accumulators.
     
     Args:
-        fig (plotly.graph_objects.Figure): The figure to add the connection to.
+        lines (dict): Line accumulator keyed by (line_type, line_width).
+        arrows (dict): Arrowhead accumulator with "x" and "y" lists.
         x1, y1 (float): Starting point coordinates.
         x2, y2 (float): Ending point coordinates.
         cx, cy (float): Control point coordinates.
@@ -665,25 +748,14 @@ def draw_custom_curve(fig, x1, y1, x2, y2, cx, cy, line_type="solid", line_width
         hover_text (str, optional): The hover text for the connection. Defaults to None.
     """
     # Generate points for a quadratic Bezier curve
-    t = np.linspace(0, 1, 50)
+    t = _ARC_STEPS
     
     # Quadratic Bezier formula: B(t) = (1-t)²P₀ + 2(1-t)tP₁ + t²P₂
-    x = (1-t)**2 * x1 + 2*(1-t)*t * cx + t**2 * x2
-    y = (1-t)**2 * y1 + 2*(1-t)*t * cy + t**2 * y2
-    
-    # Draw the curved connection
-    fig.add_trace(go.Scatter(
-        x=x, y=y,
-        mode="lines",
-        line=dict(
-            color="#555",
-            width=line_width,
-            dash="dash" if line_type == "dash" else "solid"
-        ),
-        hoverinfo="text" if hover_text else "none",
-        text=hover_text,
-        showlegend=False
-    ))
+    x = _BEZIER_START * x1 + _BEZIER_CONTROL * cx + _BEZIER_END * x2
+    y = _BEZIER_START * y1 + _BEZIER_CONTROL * cy + _BEZIER_END * y2
+    
+    # Add the curved connection
+    append_line(lines, x, y, line_type, line_width, hover_text)
     
     # Add an arrow at the end
     # Calculate the direction at the end point (derivative of the Bezier curve)
@@ -691,25 +763,159 @@ def draw_custom_curve(fig, x1, y1, x2, y2, cx, cy, line_type="solid", line_width
     dy_end = 2*(1-t[-1])*(cy-y1) + 2*t[-1]*(y2-cy)
     
     # Normalize the direction vector
-    length = math.sqrt(dx_end**2 + dy_end**2)
+    length = math.hypot(dx_end, dy_end)
     if length > 0:
-        dx_end /= length
-        dy_end /= length
+        inv_length = 1.0 / length
+        dx_end *= inv_length
+        dy_end *= inv_length
     
     # Perpendicular vectors for the arrow
     perpx = -dy_end
     perpy = dx_end
     
+    # Offsets of the two back corners from the tip
     arrow_length = 0.025
-    arrow_x = [x[-1], 
-               x[-1] - arrow_length * (dx_end - perpx * 0.5), 
-               x[-1] - arrow_length * (dx_end + perpx * 0.5)]
-    arrow_y = [y[-1], 
-               y[-1] - arrow_length * (dy_end - perpy * 0.5), 
-               y[-1] - arrow_length * (dy_end + perpy * 0.5)]
-    
-    fig.add_trace(go.Scatter(
-        x=arrow_x, y=arrow_y,
+    back_x = arrow_length * dx_end
+    back_y = arrow_length * dy_end
+    side_x = arrow_length * perpx * 0.5
+    side_y = arrow_length * perpy * 0.5
+    
+    end_x = x[-1]
+    end_y = y[-1]
+    arrow_x = [end_x, end_x - back_x + side_x, end_x - back_x - side_x]
+    arrow_y = [end_y, end_y - back_y + side_y, end_y - back_y - side_y]
+    
+    append_arrow(arrows, arrow_x, arrow_y)
+
+def append_line(lines, x, y, line_type, line_width, hover_text=None):
+    """
+    Append a polyline to a line accumulator, separated from earlier lines by a gap.
+    
+    Args:
+        lines (dict): Line accumulator keyed by (line_type, line_width).
+        x (numpy.ndarray): The x coordinates of the line.
+        y (numpy.ndarray): The y coordinates of the line.
+        line_type (str): The type of line ("solid" or "dash").
+        line_width (float): The width of the line.
+        hover_text (str, optional): The hover text for every point of the line. Defaults to None.
+    """
+    batch = lines[(line_type, line_width)]
+    batch["x"].extend(_rounded(x))
+    batch["x"].append(None)
+    batch["y"].extend(_rounded(y))
+    batch["y"].append(None)
+    batch["text"].extend([hover_text] * len(x))
+    batch["text"].append(None)
+
+def add_line_traces(traces, lines, use_webgl=False):
+    """
+    Add one trace per line style from a line accumulator.
+    
+    Args:
+        traces (list): The trace list to add the lines to.
+        lines (dict): Line accumulator filled by append_line().
+        use_webgl (bool, optional): Whether to draw the lines as WebGL traces. Defaults to False.
+    """
+    trace_type = "scattergl" if use_webgl else "scatter"
+    
+    for (line_type, line_width), batch in lines.items():
+        traces.append(dict(
+            type=trace_type,
+            x=batch["x"], y=batch["y"],
+            mode="lines",
+            line=dict(
+                color="#555",
+                width=line_width,
+                dash="dash" if line_type == "dash" else "solid"
+            ),
+            hoverinfo="text",
+            text=batch["text"],
+            showlegend=False
+        ))
+
+def append_connections(lines, arrows, angles1, angles2, radius, line_type, line_width, hover_texts):
+    """
+    Append several connection arcs of one style, with their arrowheads, to the accumulators.
+    
+    Each arc takes the shorter way around the circle and ends in an arrowhead
+    perpendicular to its radius; all arcs are computed at once.
+    
+    Args:
+        lines (dict): Line accumulator keyed by (line_type, line_width).
+        arrows (dict): Arrowhead accumulator with "x" and "y" lists.
+        angles1 (list): The starting angle of each connection in radians.
+        angles2 (list): The ending angle of each connection in radians.
+        radius (float): The radius of the circle.
+        line_type (str): The type of line ("solid" or "dash").
+        line_width (float): The width of the line.
+        hover_texts (list): The hover text for each connection.
+    """
+    angles1 = np.asarray(angles1, dtype=float)
+    angles2 = np.asarray(angles2, dtype=float)
+    
+    # Ensure angles are in the right order for the shortest path
+    wrap = np.abs(angles2 - angles1) > math.pi
+    forward = angles1 < angles2
+    angles1 = angles1 + 2 * math.pi * (wrap & forward)
+    angles2 = angles2 + 2 * math.pi * (wrap & ~forward)
+    
+    # Create angles for all arcs, one row per connection
+    theta = angles1[:, None] + _ARC_STEPS * (angles2 - angles1)[:, None]
+    
+    # Calculate points on the arcs
+    x = radius * np.cos(theta)
+    y = radius * np.sin(theta)
+    
+    # Arrowheads at the end of each arc, perpendicular to the tangent
+    arrow_angles = theta[:, -1] + math.pi / 2
+    arrow_length = 0.025
+    end_x = x[:, -1]
+    end_y = y[:, -1]
+    arrow_x = np.column_stack([
+        end_x,
+        end_x + arrow_length * np.cos(arrow_angles + math.pi/8),
+        end_x + arrow_length * np.cos(arrow_angles - math.pi/8)
+    ])
+    arrow_y = np.column_stack([
+        end_y,
+        end_y + arrow_length * np.sin(arrow_angles + math.pi/8),
+        end_y + arrow_length * np.sin(arrow_angles - math.pi/8)
+    ])
+    
+    for row_x, row_y, hover_text, head_x, head_y in zip(x, y, hover_texts, arrow_x, arrow_y):
+        append_line(lines, row_x, row_y, line_type, line_width, hover_text)
+        append_arrow(arrows, head_x, head_y)
+
+def append_arrow(arrows, arrow_x, arrow_y):
+    """
+    Append an arrowhead triangle to an arrowhead accumulator.
+    
+    Args:
+        arrows (dict): Arrowhead accumulator with "x" and "y" lists.
+        arrow_x (array-like): The x coordinates of the triangle.
+        arrow_y (array-like): The y coordinates of the triangle.
+    """
+    arrows["x"].extend(_rounded(arrow_x))
+    arrows["x"].append(None)
+    arrows["y"].extend(_rounded(arrow_y))
+    arrows["y"].append(None)
+
+def add_arrow_trace(traces, arrows, use_webgl=False):
+    """
+    Add all arrowheads from an arrowhead accumulator as one filled trace.
+    
+    Args:
+        traces (list): The trace list to add the arrowheads to.
+        arrows (dict): Arrowhead accumulator filled by append_arrow().
+        use_webgl (bool, optional): Whether to draw the arrowheads as a WebGL trace. Defaults to False.
+    """
+    if not arrows["x"]:
+        return
+    
+    trace_type = "scattergl" if use_webgl else "scatter"
+    traces.append(dict(
+        type=trace_type,
+        x=arrows["x"], y=arrows["y"],
         fill="toself",
         fillcolor="#555",
         line=dict(color="#555"),
@@ -717,6 +923,7 @@ def draw_custom_curve(fig, x1, y1, x2, y2, cx, cy, line_type="solid", line_width
         showlegend=False
     ))
 
+@lru_cache(maxsize=256)
 def lighten_color(color, factor=0.2):
     """
     Lighten a color by the given factor.
@@ -728,18 +935,16 @@ def lighten_color(color, factor=0.2):
     Returns:
         str: The lightened color in hex format.
     """
-    # Remove '#' if present
-    color = color.lstrip('#')
-    
-    # Convert hex to RGB
-    r = int(color[0:2], 16)
-    g = int(color[2:4], 16)
-    b = int(color[4:6], 16)
+    # Parse the hex color once and unpack the channels from the packed value
+    value = int(color.lstrip('#'), 16)
+    r = value >> 16
+    g = (value >> 8) & 0xff
+    b = value & 0xff
     
     # Lighten
-    r = min(int(r + (255 - r) * factor), 255)
-    g = min(int(g + (255 - g) * factor), 255)
-    b = min(int(b + (255 - b) * factor), 255)
+    r = min(r + int((255 - r) * factor), 255)
+    g = min(g + int((255 - g) * factor), 255)
+    b = min(b + int((255 - b) * factor), 255)
     
     # Convert back to hex
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return f"#{(r << 16) | (g << 8) | b:06x}"